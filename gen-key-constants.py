@@ -238,10 +238,11 @@ def patch_file(path: str, what: str, text: str, start_marker: str = '/* ', end_m
             end = raw.index(end_q)
         except ValueError:
             raise SystemExit(f'Failed to find "{end_q}" in {path}')
-        raw = f'{raw[:start]}{start_q}\n{text}\n{raw[end:]}'
-        f.seek(0)
-        f.truncate(0)
-        f.write(raw)
+        nraw = f'{raw[:start]}{start_q}\n{text}\n{raw[end:]}'
+        if nraw != raw:
+            f.seek(0)
+            f.truncate(0)
+            f.write(nraw)
 
 
 def serialize_dict(x: Dict[Any, Any]) -> str:
@@ -5,6 +5,7 @@
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import date
 from functools import partial
@@ -27,7 +28,7 @@
 emoji_skin_tone_modifiers = frozenset(range(0x1f3fb, 0x1F3FF + 1))
 
 
-def get_data(fname: str, folder: str = 'UCD') -> Iterable[str]:
+def fetch_data(fname: str, folder: str = 'UCD') -> bytes:
     url = f'https://www.unicode.org/Public/{folder}/latest/{fname}'
     bn = os.path.basename(url)
     local = os.path.join('/tmp', bn)
@@ -38,6 +39,19 @@ def get_data(fname: str, folder: str = 'UCD') -> Iterable[str]:
         data = urlopen(url).read()
         with open(local, 'wb') as f:
             f.write(data)
+    return data
+
+
+def prefetch_data(*fnames: Tuple[str, str]) -> None:
+    # download all needed data files in parallel, rather than one after
+    # another as they are parsed
+    with ThreadPoolExecutor() as executor:
+        for _ in executor.map(lambda x: fetch_data(*x), fnames):
+            pass
+
+
+def get_data(fname: str, folder: str = 'UCD') -> Iterable[str]:
+    data = fetch_data(fname, folder)
     for line in data.decode('utf-8').splitlines():
         line = line.strip()
         if line and not line.startswith('#'):
@@ -565,6 +579,10 @@ def add(p: Callable[..., None], comment: str, chars_: Union[Set[int], FrozenSet[
         p('\treturn 1;\n}')
 
 
+prefetch_data(
+    ('ucd/UnicodeData.txt', 'UCD'), ('ucd/PropList.txt', 'UCD'),
+    ('emoji-sequences.txt', 'emoji'), ('ucd/EastAsianWidth.txt', 'UCD'),
+)
 parse_ucd()
 parse_prop_list()
 parse_emoji()
@@ -20,6 +20,7 @@
 import traceback
 from base64 import standard_b64decode, standard_b64encode
 from contextlib import contextmanager, suppress
+from functools import lru_cache
 from getpass import getuser
 from select import select
 from typing import (
@@ -240,14 +241,25 @@ def safe_remove(x: str) -> None:
         os.remove(x)
 
 
-def prepare_script(ans: str, replacements: Dict[str, str], script_type: str) -> str:
-    for k in ('EXEC_CMD', 'EXPORT_HOME_CMD'):
-        replacements[k] = replacements.get(k, '')
+bootstrap_script_placeholders = (
+    'EXPORT_HOME_CMD', 'EXEC_CMD', 'TEST_SCRIPT', 'REQUEST_DATA', 'ECHO_ON',
+    'REQUEST_ID', 'DATA_PASSWORD', 'PASSWORD_FILENAME',
+)
 
-    def sub(m: 're.Match[str]') -> str:
-        return replacements[m.group()]
 
-    return re.sub('|'.join(fr'\b{k}\b' for k in replacements), sub, ans)
+@lru_cache(maxsize=2)
+def bootstrap_script_template(script_type: str) -> Tuple[str, ...]:
+    # The template is split at the placeholders once, the odd numbered items
+    # are the placeholders and the even numbered items the text between them
+    with open(os.path.join(shell_integration_dir, 'ssh', f'bootstrap.{script_type}')) as f:
+        raw = f.read()
+    return tuple(re.split(r'\b({})\b'.format('|'.join(bootstrap_script_placeholders)), raw))
+
+
+def prepare_script(parts: Sequence[str], replacements: Dict[str, str], script_type: str) -> str:
+    for k in ('EXEC_CMD', 'EXPORT_HOME_CMD'):
+        replacements[k] = replacements.get(k, '')
+    return ''.join(replacements.get(x, x) if i % 2 else x for i, x in enumerate(parts))
 
 
 def prepare_exec_cmd(remote_args: Sequence[str], is_python: bool) -> str:
@@ -282,8 +294,6 @@ def bootstrap_script(
     is_python = script_type == 'py'
     export_home_cmd = prepare_export_home_cmd(ssh_opts, is_python) if 'HOME' in ssh_opts.env else ''
     exec_cmd = prepare_exec_cmd(remote_args, is_python) if remote_args else ''
-    with open(os.path.join(shell_integration_dir, 'ssh', f'bootstrap.{script_type}')) as f:
-        ans = f.read()
     pw = secrets.token_hex()
     tfd = standard_b64encode(make_tarfile(ssh_opts, dict(os.environ), 'gz' if script_type == 'sh' else 'bz2', literal_env=literal_env)).decode('ascii')
     data = {'pw': pw, 'opts': ssh_opts._asdict(), 'hostname': cli_hostname, 'uname': cli_uname, 'tarfile': tfd}
@@ -298,7 +308,7 @@ def bootstrap_script(
     if request_data:
         sd.update(sensitive_data)
     replacements.update(sensitive_data)
-    return prepare_script(ans, sd, script_type), replacements, shm_name
+    return prepare_script(bootstrap_script_template(script_type), sd, script_type), replacements, shm_name
 
 
 def get_ssh_cli() -> Tuple[Set[str], Set[str]]:
@@ -478,6 +488,9 @@ def parse_ssh_args(args: List[str], extra_args: Tuple[str, ...] = ()) -> Tuple[L
     return ssh_args, server_args, passthrough, tuple(found_extra_args)
 
 
+bootstrap_script_escapes = str.maketrans("'\\\n!", '\v\f\r\b')
+
+
 def wrap_bootstrap_script(sh_script: str, interpreter: str) -> List[str]:
     # sshd will execute the command we pass it by join all command line
     # arguments with a space and passing it as a single argument to the users
@@ -497,7 +510,7 @@ def wrap_bootstrap_script(sh_script: str, interpreter: str) -> List[str]:
         # we quote the bootstrap script by replacing ' and \ with \v and \f
         # also replacing \n and ! with \r and \b for tcsh
         # finally surrounding with '
-        es = "'" + sh_script.replace("'", '\v').replace('\\', '\f').replace('\n', '\r').replace('!', '\b') + "'"
+        es = "'" + sh_script.translate(bootstrap_script_escapes) + "'"
         unwrap_script = r"""'eval "$(echo "$0" | tr \\\v\\\f\\\r\\\b \\\047\\\134\\\n\\\041)"' """
     # exec is supported by all sh like shells, and fish and csh
     return ['exec', interpreter, '-c', unwrap_script, es]
@@ -1490,11 +1490,15 @@ def notify_on_os_window_death(self, address: str) -> None:
 
     def display_scrollback(self, window: Window, data: Union[bytes, str], input_line_number: int = 0, title: str = '', report_cursor: bool = True) -> None:
 
+        replacements = {
+            'INPUT_LINE_NUMBER': str(input_line_number),
+            'CURSOR_LINE': str(window.screen.cursor.y + 1) if report_cursor else '0',
+            'CURSOR_COLUMN': str(window.screen.cursor.x + 1) if report_cursor else '0',
+        }
+        pat = re.compile('|'.join(replacements))
+
         def prepare_arg(x: str) -> str:
-            x = x.replace('INPUT_LINE_NUMBER', str(input_line_number))
-            x = x.replace('CURSOR_LINE', str(window.screen.cursor.y + 1) if report_cursor else '0')
-            x = x.replace('CURSOR_COLUMN', str(window.screen.cursor.x + 1) if report_cursor else '0')
-            return x
+            return pat.sub(lambda m: replacements[m.group()], x)
 
         cmd = list(map(prepare_arg, get_options().scrollback_pager))
         if not os.path.isabs(cmd[0]):
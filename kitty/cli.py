@@ -5,6 +5,7 @@
 import shlex
 import sys
 from collections import deque
+from functools import lru_cache
 from typing import (
     Any, Callable, Dict, FrozenSet, Iterator, List, Match, Optional, Sequence,
     Tuple, Type, TypeVar, Union, cast
@@ -219,6 +220,7 @@ def disc(x: str) -> str:
 OptionSpecSeq = List[Union[str, OptionDict]]
 
 
+@lru_cache(maxsize=64)
 def parse_option_spec(spec: Optional[str] = None) -> Tuple[OptionSpecSeq, OptionSpecSeq]:
     if spec is None:
         spec = options_spec()
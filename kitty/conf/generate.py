@@ -429,20 +429,30 @@ def generate_c_conversion(loc: str, ctypes: List[Union[Option, MultiOption]]) ->
     return '\n'.join(preamble + ['', ''] + lines)
 
 
+def write_if_changed(path: str, text: str) -> None:
+    # Leave unchanged files alone so their mtimes are not bumped, which
+    # would cause everything that depends on them to be rebuilt
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return
+    except FileNotFoundError:
+        pass
+    with open(path, 'w') as f:
+        f.write(text)
+
+
 def write_output(loc: str, defn: Definition) -> None:
     cls, tc = generate_class(defn, loc)
-    with open(os.path.join(*loc.split('.'), 'options', 'types.py'), 'w') as f:
-        f.write(f'{cls}\n')
-    with open(os.path.join(*loc.split('.'), 'options', 'parse.py'), 'w') as f:
-        f.write(f'{tc}\n')
+    write_if_changed(os.path.join(*loc.split('.'), 'options', 'types.py'), f'{cls}\n')
+    write_if_changed(os.path.join(*loc.split('.'), 'options', 'parse.py'), f'{tc}\n')
     ctypes = []
     for opt in defn.root_group.iter_all_non_groups():
         if isinstance(opt, (Option, MultiOption)) and opt.ctype:
             ctypes.append(opt)
     if ctypes:
         c = generate_c_conversion(loc, ctypes)
-        with open(os.path.join(*loc.split('.'), 'options', 'to-c-generated.h'), 'w') as f:
-            f.write(f'{c}\n')
+        write_if_changed(os.path.join(*loc.split('.'), 'options', 'to-c-generated.h'), f'{c}\n')
 
 
 def main() -> None:
@@ -467,7 +477,5 @@ def main() -> None:
     defn = getattr(m, 'definition')
     loc = package_name
     cls, tc = generate_class(defn, loc)
-    with open(os.path.join(os.path.dirname(path), 'kitten_options_types.py'), 'w') as f:
-        f.write(f'{cls}\n')
-    with open(os.path.join(os.path.dirname(path), 'kitten_options_parse.py'), 'w') as f:
-        f.write(f'{tc}\n')
+    write_if_changed(os.path.join(os.path.dirname(path), 'kitten_options_types.py'), f'{cls}\n')
+    write_if_changed(os.path.join(os.path.dirname(path), 'kitten_options_parse.py'), f'{tc}\n')
@@ -24,6 +24,11 @@ def set_scale(new_scale: Sequence[float]) -> None:
     scale = (new_scale[0], new_scale[1], new_scale[2], new_scale[3])
 
 
+def line_thickness_state() -> Tuple[Tuple[float, ...], float]:
+    ' The global state that line thicknesses depend on '
+    return scale, _dpi
+
+
 def thickness(level: int = 1, horizontal: bool = True) -> int:
     pts = scale[level]
     return int(math.ceil(pts * (_dpi / 72.0)))
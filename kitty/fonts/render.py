@@ -3,11 +3,11 @@
 
 import ctypes
 import sys
-from functools import partial
+from functools import lru_cache, partial
 from math import ceil, cos, floor, pi
 from typing import (
     TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional, Tuple,
-    Union, cast
+    Type, Union, cast
 )
 
 from kitty.constants import is_macos
@@ -17,7 +17,8 @@
     test_render_line, test_shape, NUM_UNDERLINE_STYLES
 )
 from kitty.fonts.box_drawing import (
-    BufType, distribute_dots, render_box_char, render_missing_glyph
+    BufType, distribute_dots, line_thickness_state, render_box_char,
+    render_missing_glyph
 )
 from kitty.options.types import Options, defaults
 from kitty.typing import CoreTextFont, FontConfigPattern
@@ -219,12 +220,19 @@ def set_font_family(opts: Optional[Options] = None, override_font_size: Optional
 UnderlineCallback = Callable[[CBufType, int, int, int, int], None]
 
 
+@lru_cache(maxsize=8)
+def char_texture_type(num_pixels: int) -> Type[CBufType]:
+    # render_box_drawing() is called for every box drawing glyph, so avoid
+    # creating a new ctypes array type each time
+    return ctypes.c_ubyte * num_pixels
+
+
 def add_line(buf: CBufType, cell_width: int, position: int, thickness: int, cell_height: int) -> None:
     y = position - thickness // 2
-    while thickness > 0 and -1 < y < cell_height:
-        thickness -= 1
-        ctypes.memset(ctypes.addressof(buf) + (cell_width * y), 255, cell_width)
-        y += 1
+    if thickness > 0 and -1 < y < cell_height:
+        # rows are contiguous so fill them all with a single memset
+        num_rows = min(thickness, cell_height - y)
+        ctypes.memset(ctypes.addressof(buf) + (cell_width * y), 255, cell_width * num_rows)
 
 
 def add_dline(buf: CBufType, cell_width: int, position: int, thickness: int, cell_height: int) -> None:
@@ -243,8 +251,9 @@ def add_dline(buf: CBufType, cell_width: int, position: int, thickness: int, cel
             top -= deficit
     top = max(0, min(top, cell_height - 1))
     bottom = max(0, min(bottom, cell_height - 1))
-    for y in {top, bottom}:
-        ctypes.memset(ctypes.addressof(buf) + (cell_width * y), 255, cell_width)
+    ctypes.memset(ctypes.addressof(buf) + (cell_width * top), 255, cell_width)
+    if bottom != top:
+        ctypes.memset(ctypes.addressof(buf) + (cell_width * bottom), 255, cell_width)
 
 
 def add_curl(buf: CBufType, cell_width: int, position: int, thickness: int, cell_height: int) -> None:
@@ -260,12 +269,6 @@ def add_curl(buf: CBufType, cell_width: int, position: int, thickness: int, cell
         half_height = thickness // 2
         thickness -= 2
 
-    def add_intensity(x: int, y: int, val: int) -> None:
-        y += position
-        y = min(y, max_y)
-        idx = cell_width * y + x
-        buf[idx] = min(255, buf[idx] + val)
-
     # Ensure curve doesn't exceed cell boundary at the bottom
     position += half_height * 2
     if position + half_height > max_y:
@@ -273,32 +276,42 @@ def add_intensity(x: int, y: int, val: int) -> None:
 
     # Use the Wu antialias algorithm to draw the curve
     # cosine waves always have slope <= 1 so are never steep
+    # intensity updates are inlined as this runs for every pixel column
     for x in range(cell_width):
         y = half_height * cos(x * xfactor)
-        y1, y2 = floor(y - thickness), ceil(y)
+        y1, y2 = floor(y - thickness) + position, ceil(y) + position
         i1 = int(255 * abs(y - floor(y)))
-        add_intensity(x, y1, 255 - i1)  # upper bound
-        add_intensity(x, y2, i1)  # lower bound
+        # upper bound
+        idx = cell_width * min(y1, max_y) + x
+        buf[idx] = min(255, buf[idx] + 255 - i1)
+        # lower bound
+        idx = cell_width * min(y2, max_y) + x
+        buf[idx] = min(255, buf[idx] + i1)
         # fill between upper and lower bound
-        for t in range(1, thickness + 1):
-            add_intensity(x, y1 + t, 255)
+        for t in range(y1 + 1, y1 + thickness + 1):
+            buf[cell_width * min(t, max_y) + x] = 255
 
 
 def add_dots(buf: CBufType, cell_width: int, position: int, thickness: int, cell_height: int) -> None:
     spacing, size = distribute_dots(cell_width, cell_width // (2 * thickness))
 
+    dot = [255] * size
     y = 1 + position - thickness // 2
     for i in range(y, min(y + thickness, cell_height)):
+        row = cell_width * i
         for j, s in enumerate(spacing):
-            buf[cell_width * i + j * size + s: cell_width * i + (j + 1) * size + s] = [255] * size
+            buf[row + j * size + s: row + (j + 1) * size + s] = dot
 
 
 def add_dashes(buf: CBufType, cell_width: int, position: int, thickness: int, cell_height: int) -> None:
     halfspace_width = cell_width // 4
+    dash_width = cell_width - 3 * halfspace_width
+    dash = [255] * dash_width
     y = 1 + position - thickness // 2
     for i in range(y, min(y + thickness, cell_height)):
-        buf[cell_width * i:cell_width * i + (cell_width - 3 * halfspace_width)] = [255] * (cell_width - 3 * halfspace_width)
-        buf[cell_width * i + 3 * halfspace_width:cell_width * (i + 1)] = [255] * (cell_width - 3 * halfspace_width)
+        row = cell_width * i
+        buf[row:row + dash_width] = dash
+        buf[row + 3 * halfspace_width:row + cell_width] = dash
 
 
 def render_special(
@@ -315,14 +328,12 @@ def render_special(
     dpi_y: float = 96.,
 ) -> CBufType:
     underline_position = min(underline_position, cell_height - sum(divmod(underline_thickness, 2)))
-    CharTexture = ctypes.c_ubyte * (cell_width * cell_height)
-
-    if missing:
-        buf = bytearray(cell_width * cell_height)
-        render_missing_glyph(buf, cell_width, cell_height)
-        return CharTexture.from_buffer(buf)
+    CharTexture = char_texture_type(cell_width * cell_height)
 
     ans = CharTexture()
+    if missing:
+        render_missing_glyph(cast(BufType, ans), cell_width, cell_height)
+        return ans
 
     def dl(f: UnderlineCallback, *a: Any) -> None:
         try:
@@ -350,24 +361,20 @@ def render_cursor(
     dpi_x: float = 0,
     dpi_y: float = 0
 ) -> CBufType:
-    CharTexture = ctypes.c_ubyte * (cell_width * cell_height)
+    CharTexture = char_texture_type(cell_width * cell_height)
     ans = CharTexture()
 
     def vert(edge: str, width_pt: float = 1) -> None:
         width = max(1, min(int(round(width_pt * dpi_x / 72.0)), cell_width))
         left = 0 if edge == 'left' else max(0, cell_width - width)
+        addr = ctypes.addressof(ans) + left
         for y in range(cell_height):
-            offset = y * cell_width + left
-            for x in range(offset, offset + width):
-                ans[x] = 255
+            ctypes.memset(addr + y * cell_width, 255, width)
 
     def horz(edge: str, height_pt: float = 1) -> None:
         height = max(1, min(int(round(height_pt * dpi_y / 72.0)), cell_height))
         top = 0 if edge == 'top' else max(0, cell_height - height)
-        for y in range(top, top + height):
-            offset = y * cell_width
-            for x in range(cell_width):
-                ans[offset + x] = 255
+        ctypes.memset(ctypes.addressof(ans) + top * cell_width, 255, height * cell_width)
 
     if which == 1:  # beam
         vert('left', cursor_beam_thickness)
@@ -393,6 +400,31 @@ def prerender_function(
     cursor_underline_thickness: float,
     dpi_x: float,
     dpi_y: float
+) -> Tuple[Tuple[int, ...], Tuple[CBufType, ...]]:
+    # The C code only copies the pre-rendered cells, so re-use them for font
+    # groups with the same metrics, such as the ones created by every
+    # setup_for_testing() call. The missing glyph also depends on the box
+    # drawing line thickness, so that is part of the key.
+    return prerender_cells(
+        cell_width, cell_height, baseline, underline_position, underline_thickness,
+        strikethrough_position, strikethrough_thickness, cursor_beam_thickness,
+        cursor_underline_thickness, dpi_x, dpi_y, line_thickness_state())
+
+
+@lru_cache(maxsize=4)
+def prerender_cells(
+    cell_width: int,
+    cell_height: int,
+    baseline: int,
+    underline_position: int,
+    underline_thickness: int,
+    strikethrough_position: int,
+    strikethrough_thickness: int,
+    cursor_beam_thickness: float,
+    cursor_underline_thickness: float,
+    dpi_x: float,
+    dpi_y: float,
+    box_drawing_state: Tuple[Tuple[float, ...], float],
 ) -> Tuple[Tuple[int, ...], Tuple[CBufType, ...]]:
     # Pre-render the special underline, strikethrough and missing and cursor cells
     f = partial(
@@ -417,7 +449,7 @@ def prerender_function(
 
 
 def render_box_drawing(codepoint: int, cell_width: int, cell_height: int, dpi: float) -> Tuple[int, CBufType]:
-    CharTexture = ctypes.c_ubyte * (cell_width * cell_height)
+    CharTexture = char_texture_type(cell_width * cell_height)
     buf = CharTexture()
     render_box_char(
         chr(codepoint), cast(BufType, buf), cell_width, cell_height, dpi
@@ -152,19 +152,24 @@
 # }}}
 
 
-@lru_cache(2)
+# The reverse maps are used when encoding/decoding every key event, so build
+# them once at import time
+_name_to_functional_number_map = {v: k for k, v in functional_key_number_to_name_map.items()}
+_functional_to_csi_number_map = {v: k for k, v in csi_number_to_functional_number_map.items()}
+_csi_number_to_letter_trailer_map = {v: k for k, v in letter_trailer_to_csi_number_map.items()}
+_letter_trailers = frozenset(letter_trailer_to_csi_number_map)
+
+
 def get_name_to_functional_number_map() -> Dict[str, int]:
-    return {v: k for k, v in functional_key_number_to_name_map.items()}
+    return _name_to_functional_number_map
 
 
-@lru_cache(2)
 def get_functional_to_csi_number_map() -> Dict[int, int]:
-    return {v: k for k, v in csi_number_to_functional_number_map.items()}
+    return _functional_to_csi_number_map
 
 
-@lru_cache(2)
 def get_csi_number_to_letter_trailer_map() -> Dict[int, str]:
-    return {v: k for k, v in letter_trailer_to_csi_number_map.items()}
+    return _csi_number_to_letter_trailer_map
 
 
 PRESS: int = 1
@@ -178,18 +183,21 @@ class EventType(IntEnum):
     RELEASE = RELEASE
 
 
-@lru_cache(maxsize=128)
+_action_to_event_type = {1: EventType.PRESS, 2: EventType.REPEAT, 3: EventType.RELEASE}
+
+
+@lru_cache(maxsize=None)
 def parse_shortcut(spec: str) -> ParsedShortcut:
     if spec.endswith('+'):
         spec = f'{spec[:-1]}plus'
     parts = spec.split('+')
     key_name = parts[-1]
     key_name = functional_key_name_aliases.get(key_name.upper(), key_name)
-    is_functional_key = key_name.upper() in get_name_to_functional_number_map()
-    if is_functional_key:
-        key_name = key_name.upper()
+    uc_key_name = key_name.upper()
+    if uc_key_name in _name_to_functional_number_map:
+        key_name = uc_key_name
     else:
-        key_name = character_key_name_aliases.get(key_name.upper(), key_name)
+        key_name = character_key_name_aliases.get(uc_key_name, key_name)
     mod_val = 0
     if len(parts) > 1:
         mods = tuple(config_mod_map.get(x.upper(), META << 8) for x in parts[:-1])
@@ -276,7 +284,7 @@ def as_window_system_event(self) -> WindowSystemKeyEvent:
             if self.num_lock:
                 mods |= defines.GLFW_MOD_NUM_LOCK
 
-        fnm = get_name_to_functional_number_map()
+        fnm = _name_to_functional_number_map
 
         def as_num(key: str) -> int:
             return (fnm.get(key) or ord(key)) if key else 0
@@ -323,15 +331,23 @@ def get_sub_sections(x: str, missing: int = 0) -> Tuple[int, ...]:
     mods = (second_section[0] - 1) if second_section else 0
     action = second_section[1] if len(second_section) > 1 else 1
     keynum = first_section[0]
-    if csi_type in 'ABCDEHFPQRS':
+    if csi_type in _letter_trailers:
         keynum = letter_trailer_to_csi_number_map[csi_type]
+    if not third_section:
+        text = ''
+    elif len(third_section) == 1:
+        text = chr(third_section[0])
+    else:
+        text = ''.join([chr(c) for c in third_section])
+    csi_to_functional = csi_number_to_functional_number_map.get
+    functional_to_name = functional_key_number_to_name_map.get
 
     def key_name(num: int) -> str:
         if not num:
             return ''
         if num != 13:
-            num = csi_number_to_functional_number_map.get(num, num)
-            ans = functional_key_number_to_name_map.get(num)
+            num = csi_to_functional(num, num)
+            ans = functional_to_name(num)
         else:
             ans = 'ENTER' if csi_type == 'u' else 'F3'
         if ans is None:
@@ -346,40 +362,53 @@ def key_name(num: int) -> str:
         key=key_name(keynum),
         shifted_key=key_name(first_section[1] if len(first_section) > 1 else 0),
         alternate_key=key_name(first_section[2] if len(first_section) > 2 else 0),
-        type={1: EventType.PRESS, 2: EventType.REPEAT, 3: EventType.RELEASE}[action],
-        text=''.join(map(chr, third_section))
+        type=_action_to_event_type[action],
+        text=text
     )
 
 
+@lru_cache(maxsize=512)
 def csi_number_for_name(key_name: str) -> int:
     if not key_name:
         return 0
-    fn = get_name_to_functional_number_map().get(key_name)
+    fn = _name_to_functional_number_map.get(key_name)
     if fn is None:
         return ord(key_name)
-    return get_functional_to_csi_number_map().get(fn, fn)
+    return _functional_to_csi_number_map.get(fn, fn)
 
 
 def encode_key_event(key_event: KeyEvent) -> str:
     key = csi_number_for_name(key_event.key)
-    shifted_key = csi_number_for_name(key_event.shifted_key)
-    alternate_key = csi_number_for_name(key_event.alternate_key)
-    lt = get_csi_number_to_letter_trailer_map()
+    lt = _csi_number_to_letter_trailer_map
     if key_event.key == 'ENTER':
         trailer = 'u'
     else:
         trailer = lt.get(key, 'u')
     if trailer != 'u':
         key = 1
+    fn = _name_to_functional_number_map.get(key_event.key)
+    if fn is not None and fn in tilde_trailers:
+        trailer = '~'
+    if key_event.type is EventType.PRESS and not (key_event.mods or key_event.shifted_key or key_event.alternate_key or key_event.text):
+        # fast path for the common case of a plain key press
+        if key == 1:
+            return '\033[' + trailer
+        return '\033[' + str(key) + trailer
+    shifted_key = csi_number_for_name(key_event.shifted_key)
+    alternate_key = csi_number_for_name(key_event.alternate_key)
     mods = key_event.mods
     text = key_event.text
-    ans = '\033['
+    ans = ['\033[']
+    a = ans.append
     if key != 1 or mods or shifted_key or alternate_key or text:
-        ans += f'{key}'
+        a(str(key))
     if shifted_key or alternate_key:
-        ans += ':' + (f'{shifted_key}' if shifted_key else '')
+        a(':')
+        if shifted_key:
+            a(str(shifted_key))
         if alternate_key:
-            ans += f':{alternate_key}'
+            a(':')
+            a(str(alternate_key))
     action = 1
     if key_event.type is EventType.REPEAT:
         action = 2
@@ -404,17 +433,18 @@ def encode_key_event(key_event: KeyEvent) -> str:
         if key_event.num_lock:
             m |= 128
         if action > 1 or m:
-            ans += f';{m+1}'
+            a(';')
+            a(str(m + 1))
             if action > 1:
-                ans += f':{action}'
+                a(':')
+                a(str(action))
         elif text:
-            ans += ';'
+            a(';')
     if text:
-        ans += ';' + ':'.join(map(str, map(ord, text)))
-    fn = get_name_to_functional_number_map().get(key_event.key)
-    if fn is not None and fn in tilde_trailers:
-        trailer = '~'
-    return ans + trailer
+        a(';')
+        a(':'.join([str(ord(c)) for c in text]))
+    a(trailer)
+    return ''.join(ans)
 
 
 def decode_key_event_as_window_system_key(text: str) -> Optional[WindowSystemKeyEvent]:
@@ -151,9 +151,11 @@ def as_str_literal(x: str) -> str:
     return '"\'"'.join(f"'{x}'" for x in parts)
 
 
+fish_str_literal_escapes = str.maketrans({'\\': '\\\\', "'": "\\'"})
+
+
 def as_fish_str_literal(x: str) -> str:
-    x = x.replace('\\', '\\\\').replace("'", "\\'")
-    return f"'{x}'"
+    return f"'{x.translate(fish_str_literal_escapes)}'"
 
 
 def posix_serialize_env(env: Dict[str, str], prefix: str = 'builtin export', sep: str = '=') -> str:
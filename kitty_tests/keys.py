@@ -5,7 +5,8 @@
 
 import kitty.fast_data_types as defines
 from kitty.key_encoding import (
-    EventType, KeyEvent, decode_key_event, encode_key_event
+    EventType, KeyEvent, decode_key_event, encode_key_event,
+    functional_key_number_to_name_map
 )
 
 from . import BaseTest
@@ -480,6 +481,10 @@ def mkp(name, *a, **kw):
                                 ec = encode_key_event(ev)
                                 q = decode_key_event(ec[2:-1], ec[-1])
                                 self.ae(ev, q)
+        for key in functional_key_number_to_name_map.values():
+            ev = KeyEvent(key=key)
+            ec = encode_key_event(ev)
+            self.ae(ev, decode_key_event(ec[2:-1], ec[-1]))
 
     def test_encode_mouse_event(self):
         NORMAL_PROTOCOL, UTF8_PROTOCOL, SGR_PROTOCOL, URXVT_PROTOCOL = range(4)